@@ -6,6 +6,7 @@ FastAPI server with CORS enabled for frontend integration
 from fastapi import FastAPI, File, UploadFile, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from typing import List
+import os
 import uvicorn
 
 app = FastAPI(title="Synth AI Audit Engine")
@@ -101,4 +102,7 @@ if __name__ == "__main__":
     print("📖 API docs at: http://127.0.0.1:8000/docs")
     print("="*50 + "\n")
     
-    uvicorn.run(app, host="127.0.0.1", port=8000, reload=True)
\ No newline at end of file
+    # Auto-reload only when DEV is set: it needs the import-string form and
+    # runs a file watcher alongside the server.
+    dev = bool(os.getenv("DEV"))
+    uvicorn.run("app:app" if dev else app, host="127.0.0.1", port=8000, reload=dev)
\ No newline at end of file
@@ -1,19 +1,26 @@
 from collections import Counter
 
+import ahocorasick
+
 CATEGORIES = {
     "Order Status": ["where is my order", "tracking"],
     "Refund/Return": ["refund", "return"],
     "Payment Issues": ["payment failed", "charged"],
 }
 
-def analyze_emails(email_list):
-    counts = Counter()
-
-    for email in email_list:
-        text = email.lower()
+# One automaton over every keyword: a single pass per email reports all
+# category hits, however many keywords the categories grow to.
+_AUTOMATON = ahocorasick.Automaton()
+for _category, _keywords in CATEGORIES.items():
+    for _keyword in _keywords:
+        _AUTOMATON.add_word(_keyword.lower(), _category)
+_AUTOMATON.make_automaton()
 
-        for category, keywords in CATEGORIES.items():
-            if any(keyword in text for keyword in keywords):
-                counts[category] += 1
 
-    return counts
+def analyze_emails(email_list):
+    # An email counts once per category, however many of its keywords match
+    return Counter(
+        category
+        for email in email_list
+        for category in {category for _, category in _AUTOMATON.iter(email.lower())}
+    )
@@ -3,26 +3,33 @@ load_dotenv()
 
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi import FastAPI, UploadFile, File, HTTPException, Request
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi import FastAPI, UploadFile, File, HTTPException
+from fastapi.responses import FileResponse, JSONResponse, ORJSONResponse
 from typing import List
-import shutil
+from contextlib import asynccontextmanager
+import asyncio
 import os
 import re
+import secrets
+import string
 import uuid
 import time
-import hashlib
+import threading
 import uvicorn
-from collections import Counter, defaultdict
+import aiofiles
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+from collections import defaultdict, deque
 
-from services.audit_runner import run_audit_pipeline
-from services.file_parser import parse_file
+from services.audit_runner import run_audit_pipeline, warm_report_builder
+from services.file_parser import parse_file, shutdown_pdf_pool
 from services.ai_classifier import classify_bulk, generate_recommendations, get_available_industries
 
 import sqlite3
 from pydantic import BaseModel, EmailStr
 from passlib.context import CryptContext
-from jose import JWTError, jwt
+import jwt
 from datetime import datetime, timedelta
 from typing import Optional
 
@@ -31,9 +38,16 @@ from typing import Optional
 MAX_FILE_SIZE_MB = 10           # Max size per file (MB)
 MAX_TOTAL_SIZE_MB = 50          # Max total upload size (MB)
 MAX_FILES_PER_REQUEST = 10      # Max number of files per audit
-MAX_REQUESTS_PER_MINUTE = 10    # Rate limit per IP
-ALLOWED_EXTENSIONS = {".csv", ".xlsx", ".xls", ".pdf", ".txt", ".png", ".jpg", ".jpeg", ".gif", ".bmp", ".eml"}
-BLOCKED_EXTENSIONS = {".exe", ".bat", ".cmd", ".sh", ".ps1", ".dll", ".so", ".py", ".js", ".php", ".rb", ".jar", ".msi"}
+MAX_REQUESTS_PER_MINUTE = 10    # Rate limit per IP, per endpoint
+RATE_LIMITED_PATHS = frozenset({"/audit", "/signup", "/login"})
+MAX_FILE_SIZE_BYTES = MAX_FILE_SIZE_MB * 1024 * 1024
+MAX_TOTAL_SIZE_BYTES = MAX_TOTAL_SIZE_MB * 1024 * 1024
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # Uploads are streamed to disk 1 MiB at a time
+PARSE_CONCURRENCY = min(MAX_FILES_PER_REQUEST, os.cpu_count() or 1)  # Files parsed at once, per worker
+ALLOWED_EXTENSIONS = frozenset({".csv", ".xlsx", ".xls", ".pdf", ".txt", ".png", ".jpg", ".jpeg", ".gif", ".bmp", ".eml"})
+BLOCKED_EXTENSIONS = frozenset({".exe", ".bat", ".cmd", ".sh", ".ps1", ".dll", ".so", ".py", ".js", ".php", ".rb", ".jar", ".msi"})
+ALLOWED_EXTENSIONS_TEXT = ", ".join(sorted(ALLOWED_EXTENSIONS))  # For rejection messages
+DANGEROUS_CONTENT_TYPES = frozenset({"application/x-executable", "application/x-msdownload", "application/javascript"})
 
 # JWT Configuration
 SECRET_KEY = os.getenv("JWT_SECRET_KEY", "prod_secret_key_synth_ai_2024")
@@ -45,23 +59,44 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 # ─── Database Setup ──────────────────────────────────────────────────
 DB_PATH = "users.db"
 
+# One autocommit connection per process, reused by every request (queries run
+# in worker threads, serialized by db_lock). WAL lets other worker processes
+# keep reading while a signup is written.
+db = sqlite3.connect(DB_PATH, check_same_thread=False, isolation_level=None)
+db.execute("PRAGMA journal_mode=WAL")
+db.execute("PRAGMA synchronous=NORMAL")
+db_lock = threading.Lock()
+
+SELECT_USER_BY_EMAIL = "SELECT id, full_name, email, password_hash FROM users WHERE email = ?"
+INSERT_USER = "INSERT INTO users (id, full_name, email, password_hash, created_at) VALUES (?, ?, ?, ?, ?)"
+
 def init_db():
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS users (
-            id TEXT PRIMARY KEY,
-            full_name TEXT,
-            email TEXT UNIQUE,
-            password_hash TEXT,
-            created_at TIMESTAMP
-        )
-    ''')
-    conn.commit()
-    conn.close()
+    with db_lock:
+        db.execute('''
+            CREATE TABLE IF NOT EXISTS users (
+                id TEXT PRIMARY KEY,
+                full_name TEXT,
+                email TEXT UNIQUE,
+                password_hash TEXT,
+                created_at TIMESTAMP
+            )
+        ''')
 
 init_db()
 
+def fetch_user(email: str) -> Optional[tuple]:
+    with db_lock:
+        return db.execute(SELECT_USER_BY_EMAIL, (email,)).fetchone()
+
+def insert_user(user_id: str, full_name: str, email: str, password_hash: str) -> bool:
+    """Insert a new user. Returns False if the email is already registered."""
+    with db_lock:
+        try:
+            db.execute(INSERT_USER, (user_id, full_name, email, password_hash, datetime.utcnow()))
+        except sqlite3.IntegrityError:
+            return False
+    return True
+
 # ─── Auth Models ─────────────────────────────────────────────────────
 class UserCreate(BaseModel):
     full_name: str
@@ -73,6 +108,7 @@ class UserLogin(BaseModel):
     password: str
 
 class Token(BaseModel):
+    """Documents the auth response shape; not used to re-validate responses."""
     access_token: str
     token_type: str
     user: dict
@@ -84,6 +120,10 @@ def get_password_hash(password):
 def verify_password(plain_password, hashed_password):
     return pwd_context.verify(plain_password, hashed_password)
 
+# bcrypt pins a core per call; cap concurrent hashes so a signup/login burst
+# can't starve audit parsing of CPU
+kdf_semaphore = asyncio.Semaphore(max(1, (os.cpu_count() or 1) // 2))
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
     if expires_delta:
@@ -96,10 +136,24 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
 
 
 # ─── App Setup ────────────────────────────────────────────────────────
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    sweeper = asyncio.create_task(sweep_request_counts())
+    # Load reportlab off the event loop so startup isn't blocked and the first PDF isn't slow
+    report_warmup = asyncio.create_task(asyncio.to_thread(warm_report_builder))
+    yield
+    sweeper.cancel()
+    # A thread can't be interrupted: let an unfinished warmup complete before shutdown
+    await report_warmup
+    shutdown_pdf_pool()
+
+
 app = FastAPI(
     title="Synth AI Audit Engine",
+    lifespan=lifespan,
     docs_url="/docs" if os.getenv("ENVIRONMENT", "development") == "development" else None,  # Disable docs in production
     redoc_url=None,
+    default_response_class=ORJSONResponse,
 )
 
 # ─── CORS ─────────────────────────────────────────────────────────────
@@ -142,48 +196,166 @@ trusted_hosts.append("*.vercel.app")
 app.add_middleware(TrustedHostMiddleware, allowed_hosts=trusted_hosts)
 
 
+# ─── Response Compression ────────────────────────────────────────────
+class GZipExceptPDFMiddleware(GZipMiddleware):
+    """GZip JSON responses; the PDF report is already compressed, so pass it through."""
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].startswith("/download-report"):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+app.add_middleware(GZipExceptPDFMiddleware, minimum_size=1024)
+
+
 # ─── Rate Limiting ───────────────────────────────────────────────────
-request_counts: dict[str, list[float]] = defaultdict(list)
-
-@app.middleware("http")
-async def rate_limit_middleware(request: Request, call_next):
-    """Simple in-memory rate limiter. For production, use Redis-backed."""
-    # Only rate-limit the /audit endpoint
-    if request.url.path == "/audit":
-        client_ip = request.client.host if request.client else "unknown"
+# With REDIS_URL set, counts are shared by every worker process. The
+# in-memory dict is the fallback for local runs and Redis outages.
+REDIS_URL = os.getenv("REDIS_URL", "")
+# Short socket timeouts: an unreachable Redis falls back to memory in well under a second
+REDIS_TIMEOUT_SECONDS = 0.5
+redis_client = aioredis.Redis.from_url(
+    REDIS_URL,
+    socket_connect_timeout=REDIS_TIMEOUT_SECONDS,
+    socket_timeout=REDIS_TIMEOUT_SECONDS,
+) if REDIS_URL else None
+# Each "path:IP" key keeps at most MAX_REQUESTS_PER_MINUTE timestamps, oldest first
+request_counts: dict[str, deque[float]] = defaultdict(lambda: deque(maxlen=MAX_REQUESTS_PER_MINUTE))
+
+# Rolling window kept as a sorted set of request timestamps. Trimming, counting
+# and recording run as one atomic script, so concurrent workers cannot race.
+RATE_LIMIT_SCRIPT = """
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], 0, now - window)
+if redis.call('ZCARD', KEYS[1]) >= tonumber(ARGV[3]) then
+    return 0
+end
+redis.call('ZADD', KEYS[1], now, ARGV[4])
+redis.call('EXPIRE', KEYS[1], window)
+return 1
+"""
+rate_limit_script = redis_client.register_script(RATE_LIMIT_SCRIPT) if redis_client else None
+
+
+async def redis_allow_request(key: str, now: float, window: int) -> bool:
+    """Record this request in the key's rolling window unless it is already full."""
+    allowed = await rate_limit_script(
+        keys=[f"rl:{key}"],
+        args=[now, window, MAX_REQUESTS_PER_MINUTE, f"{now}:{uuid.uuid4().hex}"],
+    )
+    return allowed == 1
+
+
+async def sweep_request_counts(interval: int = 60, idle_after: int = 120):
+    """Drop in-memory rate-limit entries for clients that have gone quiet, so the dict stays bounded."""
+    while True:
+        await asyncio.sleep(interval)
+        now = time.time()
+        idle = [key for key, timestamps in request_counts.items() if not timestamps or now - timestamps[-1] > idle_after]
+        for key in idle:
+            request_counts.pop(key, None)
+
+
+def rate_limited(key: str, now: float, window: int) -> bool:
+    """In-memory rolling window: record this request unless the key is already at the limit."""
+    timestamps = request_counts[key]
+    # Clean old entries
+    while timestamps and now - timestamps[0] >= window:
+        timestamps.popleft()
+    if len(timestamps) >= MAX_REQUESTS_PER_MINUTE:
+        return True
+    timestamps.append(now)
+    return False
+
+
+class RateLimitMiddleware:
+    """Per-IP rate limiter: Redis-backed when configured, in-memory otherwise.
+
+    Plain ASGI rather than @app.middleware("http"), so requests (and upload
+    bodies) pass straight through without BaseHTTPMiddleware's stream wrapping.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        # Only rate-limit the audit and auth endpoints, each with its own budget
+        if scope["type"] != "http" or scope["path"] not in RATE_LIMITED_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        client = scope.get("client")
+        client_ip = client[0] if client else "unknown"
+        key = f"{scope['path']}:{client_ip}"
         now = time.time()
         window = 60  # 1 minute window
 
-        # Clean old entries
-        request_counts[client_ip] = [t for t in request_counts[client_ip] if now - t < window]
+        limited = None
+        if redis_client is not None:
+            try:
+                limited = not await redis_allow_request(key, now, window)
+            except RedisError as e:
+                print(f"⚠️ Redis rate limiter unavailable, falling back to in-memory: {e}")
+
+        if limited is None:
+            limited = rate_limited(key, now, window)
 
-        if len(request_counts[client_ip]) >= MAX_REQUESTS_PER_MINUTE:
-            return JSONResponse(
+        if limited:
+            response = JSONResponse(
                 status_code=429,
                 content={"error": "Rate limit exceeded. Please wait before trying again.", "retry_after_seconds": 60}
             )
+            await response(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
 
-        request_counts[client_ip].append(now)
 
-    response = await call_next(request)
-    return response
+app.add_middleware(RateLimitMiddleware)
 
 
 # ─── Security Headers Middleware ─────────────────────────────────────
-@app.middleware("http")
-async def security_headers_middleware(request: Request, call_next):
-    """Add security headers to every response."""
-    response = await call_next(request)
-    response.headers["X-Content-Type-Options"] = "nosniff"
-    response.headers["X-Frame-Options"] = "DENY"
-    response.headers["X-XSS-Protection"] = "1; mode=block"
-    response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-    response.headers["Permissions-Policy"] = "camera=(), microphone=(), geolocation=()"
-    response.headers["Cache-Control"] = "no-store, no-cache, must-revalidate"
-    # Remove server info
-    if "server" in response.headers:
-        del response.headers["server"]
-    return response
+SECURITY_HEADERS = {
+    "X-Content-Type-Options": "nosniff",
+    "X-Frame-Options": "DENY",
+    "X-XSS-Protection": "1; mode=block",
+    "Referrer-Policy": "strict-origin-when-cross-origin",
+    "Permissions-Policy": "camera=(), microphone=(), geolocation=()",
+    "Cache-Control": "no-store, no-cache, must-revalidate",
+}
+
+
+# Encoded once; every response gets the same raw header pairs
+_ENCODED_SECURITY_HEADERS = [(name.lower().encode("latin-1"), value.encode("latin-1")) for name, value in SECURITY_HEADERS.items()]
+# Replaced if the app already set them; "server" is stripped to hide server info
+_STRIPPED_HEADER_NAMES = frozenset(name for name, _ in _ENCODED_SECURITY_HEADERS) | {b"server"}
+
+
+class SecurityHeadersMiddleware:
+    """Add security headers to every response, editing the raw ASGI start message."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_headers(message):
+            if message["type"] == "http.response.start":
+                headers = [(k, v) for k, v in message.get("headers", ()) if k.lower() not in _STRIPPED_HEADER_NAMES]
+                headers.extend(_ENCODED_SECURITY_HEADERS)
+                message["headers"] = headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+
+app.add_middleware(SecurityHeadersMiddleware)
 
 
 # ─── File Security Utilities ─────────────────────────────────────────
@@ -191,20 +363,33 @@ UPLOAD_FOLDER = "uploads"
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 OUTPUT_FOLDER = "output"
 os.makedirs(OUTPUT_FOLDER, exist_ok=True)
+ABS_OUTPUT_FOLDER = os.path.abspath(OUTPUT_FOLDER)
+# Fixed path, resolved once: the download endpoint never builds it from user input
+REPORT_PATH = os.path.join(ABS_OUTPUT_FOLDER, "audit_report.pdf")
+
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^\w\-.]')
+# ASCII fast path: one bytes.translate() pass drops separators and null bytes
+# and maps every other byte outside [A-Za-z0-9_.-] to "_"
+_SAFE_ASCII_FILENAME_BYTES = frozenset((string.ascii_letters + string.digits + "_-.").encode())
+_ASCII_FILENAME_TABLE = bytes(c if c in _SAFE_ASCII_FILENAME_BYTES else ord("_") for c in range(256))
 
 
 def sanitize_filename(filename: str) -> str:
     """Sanitize filename to prevent path traversal and injection attacks."""
-    # Remove path separators and null bytes
-    filename = filename.replace("/", "").replace("\\", "").replace("\x00", "")
-    # Remove any directory components
-    filename = os.path.basename(filename)
-    # Only allow safe characters: alphanumeric, dots, hyphens, underscores
-    filename = re.sub(r'[^\w\-.]', '_', filename)
+    if filename.isascii():
+        filename = filename.encode("ascii").translate(_ASCII_FILENAME_TABLE, b"/\\\x00").decode("ascii")
+        filename = os.path.basename(filename)
+    else:
+        # Remove path separators and null bytes
+        filename = filename.replace("/", "").replace("\\", "").replace("\x00", "")
+        # Remove any directory components
+        filename = os.path.basename(filename)
+        # Only allow safe characters: alphanumeric (incl. Unicode letters), dots, hyphens, underscores
+        filename = _UNSAFE_FILENAME_CHARS.sub('_', filename)
     # Prevent hidden files
     filename = filename.lstrip('.')
-    # Add UUID prefix to prevent collisions and make names unpredictable
-    safe_name = f"{uuid.uuid4().hex[:8]}_{filename}" if filename else f"{uuid.uuid4().hex}.tmp"
+    # Add random prefix to prevent collisions and make names unpredictable
+    safe_name = f"{secrets.token_hex(4)}_{filename}" if filename else f"{secrets.token_hex(16)}.tmp"
     return safe_name
 
 
@@ -218,23 +403,61 @@ def validate_file(file: UploadFile) -> tuple[bool, str]:
     if ext in BLOCKED_EXTENSIONS:
         return False, f"File type '{ext}' is blocked for security reasons"
     if ext not in ALLOWED_EXTENSIONS:
-        return False, f"File type '{ext}' is not supported. Allowed: {', '.join(sorted(ALLOWED_EXTENSIONS))}"
+        return False, f"File type '{ext}' is not supported. Allowed: {ALLOWED_EXTENSIONS_TEXT}"
 
     # Check content type
-    dangerous_types = {"application/x-executable", "application/x-msdownload", "application/javascript"}
-    if file.content_type and file.content_type in dangerous_types:
+    if file.content_type in DANGEROUS_CONTENT_TYPES:
         return False, f"Content type '{file.content_type}' is not allowed"
 
     return True, "OK"
 
 
-def check_file_size(file_path: str) -> tuple[bool, str]:
-    """Check file size after saving."""
-    size_bytes = os.path.getsize(file_path)
-    size_mb = size_bytes / (1024 * 1024)
-    if size_mb > MAX_FILE_SIZE_MB:
-        return False, f"File exceeds {MAX_FILE_SIZE_MB}MB limit ({size_mb:.1f}MB)"
-    return True, "OK"
+# Leading bytes each binary format must start with. Text formats (.csv, .txt,
+# .eml) have no signature and are only screened for executable headers.
+FILE_SIGNATURES = {
+    ".pdf": (b"%PDF",),
+    ".xlsx": (b"PK\x03\x04",),
+    ".xls": (b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1",),
+    ".png": (b"\x89PNG\r\n\x1a\n",),
+    ".jpg": (b"\xff\xd8\xff",),
+    ".jpeg": (b"\xff\xd8\xff",),
+    ".gif": (b"GIF87a", b"GIF89a"),
+    ".bmp": (b"BM",),
+}
+EXECUTABLE_SIGNATURES = (b"MZ", b"\x7fELF", b"\xcf\xfa\xed\xfe", b"\xca\xfe\xba\xbe")
+
+
+def content_matches_extension(ext: str, head: bytes) -> bool:
+    """Check the first bytes of an upload against what its extension claims."""
+    if head.startswith(EXECUTABLE_SIGNATURES):
+        return False
+    signatures = FILE_SIGNATURES.get(ext)
+    return signatures is None or head.startswith(signatures)
+
+
+# Shared by all requests so concurrent audits don't oversubscribe the CPU
+parse_semaphore = asyncio.Semaphore(PARSE_CONCURRENCY)
+
+
+async def parse_upload(file_path: str) -> list:
+    """Parse a saved upload in a worker thread, at most PARSE_CONCURRENCY at a time."""
+    async with parse_semaphore:
+        return await asyncio.to_thread(parse_file, file_path)
+
+
+# ─── Audit Scoring ───────────────────────────────────────────────────
+# Categories that are typically automatable
+AUTOMATABLE_CATEGORIES = frozenset({
+    # Ecommerce/General
+    "Order Status", "Refund/Return", "Payment Issue", "Shipping/Delivery",
+    "Billing Inquiry", "Technical Support", "Account Access",
+    # HR
+    "Leave Request", "Payroll Query", "Benefits Inquiry",
+    # IT
+    "Access/Permissions", "Password Reset", "Software Issue",
+    # Sales
+    "New Lead", "Demo Request", "Follow-up",
+})
 
 
 # ─── Endpoints ────────────────────────────────────────────────────────
@@ -248,26 +471,18 @@ def root():
     }
 
 # ─── Authentication Endpoints ────────────────────────────────────────
-@app.post("/signup", response_model=Token)
+@app.post("/signup", responses={200: {"model": Token}})
 async def signup(user: UserCreate):
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    
     # Check if user exists
-    cursor.execute("SELECT email FROM users WHERE email = ?", (user.email,))
-    if cursor.fetchone():
-        conn.close()
+    if await asyncio.to_thread(fetch_user, user.email):
         raise HTTPException(status_code=400, detail="Email already registered")
     
-    # Create user
+    # Create user (the UNIQUE constraint catches a concurrent signup for the same email)
     user_id = str(uuid.uuid4())
-    hashed_pwd = get_password_hash(user.password)
-    cursor.execute(
-        "INSERT INTO users (id, full_name, email, password_hash, created_at) VALUES (?, ?, ?, ?, ?)",
-        (user_id, user.full_name, user.email, hashed_pwd, datetime.utcnow())
-    )
-    conn.commit()
-    conn.close()
+    async with kdf_semaphore:
+        hashed_pwd = await asyncio.to_thread(get_password_hash, user.password)
+    if not await asyncio.to_thread(insert_user, user_id, user.full_name, user.email, hashed_pwd):
+        raise HTTPException(status_code=400, detail="Email already registered")
     
     # Generate token
     user_data = {"id": user_id, "email": user.email, "full_name": user.full_name}
@@ -275,16 +490,16 @@ async def signup(user: UserCreate):
     
     return {"access_token": access_token, "token_type": "bearer", "user": user_data}
 
-@app.post("/login", response_model=Token)
+@app.post("/login", responses={200: {"model": Token}})
 async def login(user_credentials: UserLogin):
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
+    db_user = await asyncio.to_thread(fetch_user, user_credentials.email)
     
-    cursor.execute("SELECT id, full_name, email, password_hash FROM users WHERE email = ?", (user_credentials.email,))
-    db_user = cursor.fetchone()
-    conn.close()
-    
-    if not db_user or not verify_password(user_credentials.password, db_user[3]):
+    # bcrypt is deliberately slow; verify in a worker thread, off the event loop
+    if not db_user:
+        raise HTTPException(status_code=401, detail="Invalid email or password")
+    async with kdf_semaphore:
+        password_ok = await asyncio.to_thread(verify_password, user_credentials.password, db_user[3])
+    if not password_ok:
         raise HTTPException(status_code=401, detail="Invalid email or password")
     
     user_data = {"id": db_user[0], "full_name": db_user[1], "email": db_user[2]}
@@ -315,6 +530,7 @@ async def audit_files(
 
     try:
         uploaded_files = []
+        saved_files = []  # (upload, path on disk, size) in request order
         all_messages = []
         total_size = 0
 
@@ -324,52 +540,75 @@ async def audit_files(
             if not is_valid:
                 raise HTTPException(status_code=400, detail=f"File '{file.filename}' rejected: {reason}")
 
+            ext = os.path.splitext(file.filename)[1].lower()
             safe_name = sanitize_filename(file.filename)
             file_path = os.path.join(UPLOAD_FOLDER, safe_name)
 
-            with open(file_path, "wb") as buffer:
-                shutil.copyfileobj(file.file, buffer)
             saved_paths.append(file_path)
-
-            size_ok, size_msg = check_file_size(file_path)
-            if not size_ok:
-                raise HTTPException(status_code=400, detail=f"File '{file.filename}': {size_msg}")
-
-            total_size += os.path.getsize(file_path)
-            if total_size > MAX_TOTAL_SIZE_MB * 1024 * 1024:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Total upload size exceeds {MAX_TOTAL_SIZE_MB}MB limit."
-                )
+            # Stream to disk in chunks without blocking the event loop.
+            # Limits are enforced while streaming so an oversized upload is
+            # abandoned at the first chunk past the cap (the finally block
+            # removes the partial file). The first chunk is also sniffed, so a
+            # renamed executable is turned away before anything is written.
+            size = 0
+            async with aiofiles.open(file_path, "wb") as buffer:
+                while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                    if size == 0 and not content_matches_extension(ext, chunk):
+                        raise HTTPException(
+                            status_code=400,
+                            detail=f"File '{file.filename}' rejected: contents do not match the '{ext}' file type"
+                        )
+                    size += len(chunk)
+                    if size > MAX_FILE_SIZE_BYTES:
+                        raise HTTPException(
+                            status_code=413,
+                            detail=f"File '{file.filename}': File exceeds {MAX_FILE_SIZE_MB}MB limit"
+                        )
+                    if total_size + size > MAX_TOTAL_SIZE_BYTES:
+                        raise HTTPException(
+                            status_code=413,
+                            detail=f"Total upload size exceeds {MAX_TOTAL_SIZE_MB}MB limit."
+                        )
+                    await buffer.write(chunk)
+
+            total_size += size
+            saved_files.append((file, file_path, size))
 
             print(f"✅ Uploaded: {file.filename} → {safe_name}")
 
-            # Parse file content
-            try:
-                messages = parse_file(file_path)
-                all_messages.extend(messages)
+        # Parse all files concurrently; parsers are blocking (pandas, PyPDF2)
+        parse_results = await asyncio.gather(
+            *(parse_upload(file_path) for _, file_path, _ in saved_files),
+            return_exceptions=True,
+        )
 
+        for (file, _, size), messages in zip(saved_files, parse_results):
+            if isinstance(messages, Exception):
+                print(f"⚠️ Could not parse {file.filename}: {messages}")
                 uploaded_files.append({
                     "filename": file.filename,
                     "content_type": file.content_type,
-                    "size": os.path.getsize(file_path),
-                    "messages_extracted": len(messages)
-                })
-            except Exception as e:
-                print(f"⚠️ Could not parse {file.filename}: {e}")
-                uploaded_files.append({
-                    "filename": file.filename,
-                    "content_type": file.content_type,
-                    "size": os.path.getsize(file_path),
+                    "size": size,
                     "error": "File could not be parsed"
                 })
+                continue
+
+            all_messages.extend(messages)
+            uploaded_files.append({
+                "filename": file.filename,
+                "content_type": file.content_type,
+                "size": size,
+                "messages_extracted": len(messages)
+            })
 
         if not all_messages:
             raise HTTPException(status_code=400, detail="No content could be extracted from uploaded files.")
 
         # Run AI classification
         print(f"🤖 Running AI classification ({industry}) on {len(all_messages)} messages...")
-        category_counts = classify_bulk(all_messages, industry=industry)
+        # The OpenAI calls and PDF build below are blocking; run them in worker
+        # threads so the event loop keeps serving other requests meanwhile.
+        category_counts = await asyncio.to_thread(classify_bulk, all_messages, industry=industry)
 
         # Calculate savings
         total_messages = sum(category_counts.values())
@@ -381,28 +620,15 @@ async def audit_files(
         annual_money_saved = money_saved_monthly * 12
 
         # Automation score
-        # List of categories that are typically automatable
-        automatable_categories = [
-            # Ecommerce/General
-            "Order Status", "Refund/Return", "Payment Issue", "Shipping/Delivery",
-            "Billing Inquiry", "Technical Support", "Account Access",
-            # HR
-            "Leave Request", "Payroll Query", "Benefits Inquiry",
-            # IT
-            "Access/Permissions", "Password Reset", "Software Issue",
-            # Sales
-            "New Lead", "Demo Request", "Follow-up"
-        ]
-        
-        automatable_count = sum(count for cat, count in category_counts.items() if cat in automatable_categories)
-        automation_score = min(int((automatable_count / total_messages * 100)), 100) if total_messages > 0 else 0
+        automatable_count = sum(category_counts[cat] for cat in AUTOMATABLE_CATEGORIES if cat in category_counts)
+        automation_score = min(automatable_count * 100 // total_messages, 100) if total_messages > 0 else 0
 
         # Top opportunities
         top_opportunities = []
         for category, count in category_counts.most_common(5):
             if category == "Other" and len(category_counts) > 1:
                 continue # Skip "Other" in top ops if we have better ones
-            percentage = int((count / total_messages * 100)) if total_messages > 0 else 0
+            percentage = count * 100 // total_messages if total_messages > 0 else 0
             impact = "High" if percentage > 20 else "Medium" if percentage > 10 else "Low"
             top_opportunities.append({
                 "area": category,
@@ -413,9 +639,12 @@ async def audit_files(
 
         # AI-powered recommendations
         print(f"💡 Generating AI recommendations for {industry}...")
-        recommendations = generate_recommendations(category_counts, total_messages, industry=industry)
+        recommendations = await asyncio.to_thread(
+            generate_recommendations, category_counts, total_messages, industry=industry
+        )
 
-        # Build response
+        # Build response (the breakdown dict is shared with the PDF data below)
+        category_breakdown = dict(category_counts)
         audit_report = {
             "status": "success",
             "industry": industry,
@@ -427,7 +656,7 @@ async def audit_files(
                 "cost_reduction_monthly": f"₹{money_saved_monthly:,.0f}",
                 "cost_reduction_annually": f"₹{annual_money_saved:,.0f}",
                 "automation_score": f"{automation_score}/100",
-                "category_breakdown": dict(category_counts),
+                "category_breakdown": category_breakdown,
                 "top_opportunities": top_opportunities,
                 "recommendations": recommendations
             }
@@ -437,14 +666,14 @@ async def audit_files(
         try:
             audit_data = {
                 "total_messages": total_messages,
-                "category_breakdown": dict(category_counts),
+                "category_breakdown": category_breakdown,
                 "top_opportunities": top_opportunities,
                 "recommendations": recommendations,
                 "time_saved_annually": f"{annual_hours_saved:.1f} hours",
                 "cost_reduction_annually": f"₹{annual_money_saved:,.0f}",
                 "automation_score": automation_score,
             }
-            run_audit_pipeline(all_messages, audit_data)
+            await asyncio.to_thread(run_audit_pipeline, all_messages, audit_data)
             audit_report["pdf_available"] = True
         except Exception as e:
             print(f"⚠️ PDF generation failed: {e}")
@@ -474,18 +703,12 @@ async def audit_files(
 @app.get("/download-report/")
 def download_report():
     """Download the generated PDF report."""
-    file_path = os.path.abspath(os.path.join(OUTPUT_FOLDER, "audit_report.pdf"))
-
-    # Security: ensure path is within output folder
-    if not file_path.startswith(os.path.abspath(OUTPUT_FOLDER)):
-        raise HTTPException(status_code=400, detail="Invalid report path.")
-
-    if not os.path.exists(file_path):
+    if not os.path.exists(REPORT_PATH):
         raise HTTPException(status_code=404, detail="Report not found. Run audit first.")
 
-    print(f"📄 Serving report: {file_path}")
+    print(f"📄 Serving report: {REPORT_PATH}")
     return FileResponse(
-        file_path,
+        REPORT_PATH,
         media_type="application/pdf",
         filename="Synth_AI_Audit_Report.pdf",
     )
@@ -499,12 +722,15 @@ def health_check():
 
 if __name__ == "__main__":
     port = int(os.getenv("PORT", 8000))
+    workers = int(os.getenv("WEB_CONCURRENCY", 1))
     print("\n" + "="*60)
     print("🚀 Starting Synth AI Audit Backend")
     print("="*60)
-    print(f"📍 Server: http://0.0.0.0:{port}")
+    print(f"📍 Server: http://0.0.0.0:{port} ({workers} worker{'s' if workers > 1 else ''})")
     print(f"📖 API Docs: http://localhost:{port}/docs")
     print(f"🔒 Security: Rate limiting, file validation, headers enabled")
     print("="*60 + "\n")
 
-    uvicorn.run(app, host="0.0.0.0", port=port, log_level="info")
\ No newline at end of file
+    # Import string (not the app object) so uvicorn can spawn worker processes.
+    # loop/http stay on "auto", which picks uvloop + httptools wherever they install.
+    uvicorn.run("main:app", host="0.0.0.0", port=port, workers=workers, log_level="info")
\ No newline at end of file
@@ -1,14 +1,46 @@
 import os
+import re
 import json
-from openai import OpenAI
+import asyncio
+import threading
+import time
+from functools import lru_cache
+import httpx
+from openai import APIConnectionError, AsyncOpenAI, InternalServerError, OpenAI, RateLimitError
 from collections import Counter
 
+try:
+    # orjson parses the model's JSON several times faster than the stdlib
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+CLASSIFY_CONCURRENCY = 8  # Batch requests in flight at once, per audit
+CLASSIFICATION_CACHE_SIZE = 10_000  # Remembered (industry, message) classifications, per process
+BATCH_TOKEN_BUDGET = 6000  # Approx. input tokens per classification request, system prompt included
+MAX_BATCH_MESSAGES = 40  # Cap per request, keeps the JSON answer well inside max_tokens
+BATCH_API_POLL_SECONDS = (5, 300)  # Batch API status polling: first wait, longest wait (doubles in between)
+# Below this many messages, or when one category holds more than this share,
+# the rule-based recommendations say all there is to say: skip the LLM call
+RECOMMENDATION_LLM_MIN_MESSAGES = 50
+RECOMMENDATION_LLM_MAX_SHARE = 0.9
+
+# The SDK retries 429s, 5xx and connection errors with exponential backoff;
+# HTTP/2 multiplexes concurrent batch requests over a few kept-alive connections
+OPENAI_MAX_RETRIES = 5
+OPENAI_TIMEOUT_SECONDS = 60
+OPENAI_POOL_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+
 _client = None
 
 def _get_client():
     global _client
     if _client is None:
-        _client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        _client = OpenAI(
+            api_key=os.getenv("OPENAI_API_KEY"),
+            max_retries=OPENAI_MAX_RETRIES,
+            http_client=httpx.Client(http2=True, limits=OPENAI_POOL_LIMITS, timeout=OPENAI_TIMEOUT_SECONDS),
+        )
     return _client
 
 # ─── Industry-specific category sets ───────────────────────────────────
@@ -83,6 +115,24 @@ INDUSTRY_CATEGORIES = {
 }
 
 
+# Lowercased category name -> canonical name, per industry, in category order
+_CATEGORY_LOOKUP = {
+    industry: {cat.lower(): cat for cat in categories}
+    for industry, categories in INDUSTRY_CATEGORIES.items()
+}
+
+
+def _match_category(raw_category: str, industry: str = "general") -> str:
+    """Map the model's answer to a valid category: case-insensitive exact match, then containment."""
+    lookup = _CATEGORY_LOOKUP.get(industry, _CATEGORY_LOOKUP["general"])
+    raw_lower = raw_category.lower()
+    category = lookup.get(raw_lower)
+    if category is None:
+        category = next((cat for lower, cat in lookup.items() if lower in raw_lower), "Other")
+    return category
+
+
+@lru_cache(maxsize=16)
 def _build_system_prompt(industry: str = "general") -> str:
     """Build a detailed system prompt with industry-specific context and examples."""
     categories = INDUSTRY_CATEGORIES.get(industry, INDUSTRY_CATEGORIES["general"])
@@ -142,129 +192,297 @@ Example:
 """
 
 
-def classify_batch(messages: list[str], industry: str = "general", batch_size: int = 10) -> Counter:
+# ─── Classification cache ──────────────────────────────────────────────
+# Support logs repeat the same questions over and over; a message seen before
+# (after case/punctuation normalization) reuses its category instead of
+# going back to the API. Oldest entries are evicted first.
+_NON_WORD = re.compile(r"\W+")
+_classification_cache: dict[tuple[str, str], str] = {}
+_cache_lock = threading.Lock()
+
+
+def _cache_key(message: str, industry: str) -> tuple[str, str]:
+    # Same 800-char slice the batch prompt and classify_bulk's dedup use, so
+    # messages sharing a long template prefix don't collide
+    return industry, _NON_WORD.sub(" ", message.strip()[:800].lower()).strip()
+
+
+def _remember(message: str, industry: str, category: str) -> None:
+    with _cache_lock:
+        if len(_classification_cache) >= CLASSIFICATION_CACHE_SIZE:
+            _classification_cache.pop(next(iter(_classification_cache)))
+        _classification_cache[_cache_key(message, industry)] = category
+
+
+def _parse_classifications(result_text: str, industry: str = "general") -> list[tuple]:
+    """Parse one batch's model output (a JSON array) into (index, category) pairs."""
+    parsed = []
+    result_text = result_text.strip()
+    # print(f"DEBUG: AI Response:\n{result_text}")
+
+    # More robust JSON cleanup
+    if "```json" in result_text:
+        result_text = result_text.split("```json")[1].split("```")[0].strip()
+    elif "```" in result_text:
+        result_text = result_text.split("```")[1].split("```")[0].strip()
+
+    data = json_loads(result_text)
+
+    # Identify the list of classifications
+    classifications = []
+    if isinstance(data, list):
+        classifications = data
+    elif isinstance(data, dict):
+        # Look for common keys: 'classifications', 'results', 'data', 'items'
+        for key in ['classifications', 'results', 'data', 'items']:
+            if key in data and isinstance(data[key], list):
+                classifications = data[key]
+                break
+        if not classifications:
+            # Maybe it's an object where values are the items? No, usually it's a list.
+            # Just take the first list found in values
+            for val in data.values():
+                if isinstance(val, list):
+                    classifications = val
+                    break
+
+    for item in classifications:
+        category = _match_category(item.get("category", "Other"), industry)
+        parsed.append((item.get("index"), category))
+
+    return parsed
+
+
+def _batch_request(batch: list[str], industry: str) -> dict:
+    """Chat completion parameters for classifying one batch of messages."""
+    numbered_messages = "\n".join(
+        f"[Message {j}]: {msg[:800]}" for j, msg in enumerate(batch)
+    )
+    return {
+        "model": "gpt-4o-mini",
+        "messages": [
+            {"role": "system", "content": _build_system_prompt(industry)},
+            {"role": "user", "content": f"Classify these {len(batch)} messages:\n\n{numbered_messages}"},
+        ],
+        "temperature": 0.0,
+        "max_tokens": 2000,
+    }
+
+
+def _estimate_tokens(text: str) -> int:
+    """Rough token count (~4 chars per token for English), good enough for packing."""
+    return len(text) // 4 + 1
+
+
+def _pack_batches(messages: list[str], industry: str, max_messages: int) -> list[list[str]]:
     """
-    Classify messages in batches to reduce API calls and provide industry context.
+    Greedily fill each request up to BATCH_TOKEN_BUDGET: short tickets share one
+    call (and one copy of the system prompt) instead of going out 10 at a time.
     """
-    counts = Counter()
-    total = len(messages)
+    # Keep some room for the user-message preamble
+    budget = BATCH_TOKEN_BUDGET - _estimate_tokens(_build_system_prompt(industry)) - 200
+    batches, batch, used = [], [], 0
+    for msg in messages:
+        cost = _estimate_tokens(msg[:800]) + 8  # "[Message n]: " prefix and newline
+        if batch and (used + cost > budget or len(batch) >= max_messages):
+            batches.append(batch)
+            batch, used = [], 0
+        batch.append(msg)
+        used += cost
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def _assign_categories(batch: list[str], result_text: str, industry: str) -> list[str]:
+    """
+    Turn one batch's model output into a category per message, caching each.
+    Items are placed by their "index" (by position when it is missing or out of
+    range); messages the model skipped count as "Other" and are not cached.
+    """
+    categories = ["Other"] * len(batch)
+    for position, (index, category) in enumerate(_parse_classifications(result_text, industry)):
+        if not (isinstance(index, int) and 0 <= index < len(batch)):
+            index = position
+        if index < len(batch):
+            categories[index] = category
+            _remember(batch[index], industry, category)
+    return categories
+
+
+async def _classify_one_batch(client: AsyncOpenAI, batch: list[str], industry: str, semaphore: asyncio.Semaphore) -> list[str]:
+    """Classify one batch with a single chat call; fall back to per-message calls if that fails."""
+    try:
+        async with semaphore:
+            response = await client.chat.completions.create(**_batch_request(batch, industry))
+        return _assign_categories(batch, response.choices[0].message.content, industry)
 
-    if not messages:
-        return counts
+    except (RateLimitError, APIConnectionError, InternalServerError) as e:
+        # Rate limit / outage still failing after the SDK's retries; per-message calls would hit the same wall
+        print(f"⚠️ Batch request failed: {e}")
+        return ["Other"] * len(batch)
 
-    for i in range(0, total, batch_size):
-        batch = messages[i : i + batch_size]
-        numbered_messages = "\n".join(
-            f"[Message {j}]: {msg[:800]}" for j, msg in enumerate(batch)
+    except Exception as e:
+        # Bad request, unparseable output, ...: usually one message's fault, so don't blank the rest
+        print(f"Batch request/parse error: {e}")
+        # Retry the batch's messages one by one, all at once
+        return list(await asyncio.gather(
+            *(_aclassify_single(client, msg, industry, semaphore) for msg in batch)
+        ))
+
+
+async def _classify_batches(batches: list[list[str]], industry: str) -> list[str]:
+    """Send every batch at once, at most CLASSIFY_CONCURRENCY requests in flight."""
+    try:
+        # A fresh async client per run: its connection pool is tied to this event loop
+        client = AsyncOpenAI(
+            api_key=os.getenv("OPENAI_API_KEY"),
+            max_retries=OPENAI_MAX_RETRIES,
+            http_client=httpx.AsyncClient(http2=True, limits=OPENAI_POOL_LIMITS, timeout=OPENAI_TIMEOUT_SECONDS),
         )
+    except Exception as e:
+        print(f"⚠️ OpenAI client unavailable: {e}")
+        return ["Other"] * sum(len(batch) for batch in batches)
 
-        try:
-            response = _get_client().chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": _build_system_prompt(industry)},
-                    {"role": "user", "content": f"Classify these {len(batch)} messages:\n\n{numbered_messages}"},
-                ],
-                temperature=0.0,
-                max_tokens=2000,
-            )
+    semaphore = asyncio.Semaphore(CLASSIFY_CONCURRENCY)
+    async with client:
+        results = await asyncio.gather(
+            *(_classify_one_batch(client, batch, industry, semaphore) for batch in batches)
+        )
+    return [category for batch_categories in results for category in batch_categories]
 
-            result_text = response.choices[0].message.content.strip()
-            # print(f"DEBUG: AI Response for batch {i//batch_size}:\n{result_text}")
-            
-            # More robust JSON cleanup
-            if "```json" in result_text:
-                result_text = result_text.split("```json")[1].split("```")[0].strip()
-            elif "```" in result_text:
-                result_text = result_text.split("```")[1].split("```")[0].strip()
-
-            data = json.loads(result_text)
-            
-            # Identify the list of classifications
-            classifications = []
-            if isinstance(data, list):
-                classifications = data
-            elif isinstance(data, dict):
-                # Look for common keys: 'classifications', 'results', 'data'
-                for key in ['classifications', 'results', 'data', 'items']:
-                    if key in data and isinstance(data[key], list):
-                        classifications = data[key]
-                        break
-                if not classifications:
-                    # Maybe it's an object where values are the items? No, usually it's a list.
-                    # Just take the first list found in values
-                    for val in data.values():
-                        if isinstance(val, list):
-                            classifications = val
-                            break
-
-            valid_categories = set(INDUSTRY_CATEGORIES.get(industry, INDUSTRY_CATEGORIES["general"]))
-
-            for item in classifications:
-                raw_category = item.get("category", "Other")
-                category = "Other"
-                
-                # Try exact match
-                if raw_category in valid_categories:
-                    category = raw_category
-                else:
-                    # Try case-insensitive and partial matches
-                    for valid in valid_categories:
-                        if valid.lower() == raw_category.lower() or valid.lower() in raw_category.lower():
-                            category = valid
-                            break
-                
-                counts[category] += 1
 
+def _classify_with_batch_api(batches: list[list[str]], industry: str) -> list[str]:
+    """
+    Classify through the OpenAI Batch API: half the token price, but results can
+    take up to 24h. Blocks, polling with exponential backoff, until the job ends.
+    """
+    client = _get_client()
+    requests_jsonl = "\n".join(
+        json.dumps({"custom_id": f"b{i}", "method": "POST", "url": "/v1/chat/completions", "body": _batch_request(batch, industry)})
+        for i, batch in enumerate(batches)
+    )
+    input_file = client.files.create(file=("classify.jsonl", requests_jsonl.encode("utf-8")), purpose="batch")
+    job = client.batches.create(input_file_id=input_file.id, endpoint="/v1/chat/completions", completion_window="24h")
+    print(f"📦 Submitted Batch API job {job.id} ({len(batches)} batches)")
+
+    delay, max_delay = BATCH_API_POLL_SECONDS
+    while job.status not in ("completed", "failed", "expired", "cancelled"):
+        time.sleep(delay)
+        delay = min(delay * 2, max_delay)
+        job = client.batches.retrieve(job.id)
+    if job.status != "completed":
+        raise RuntimeError(f"Batch API job {job.id} ended with status '{job.status}'")
+
+    results = [None] * len(batches)
+    output = client.files.content(job.output_file_id).text if job.output_file_id else ""
+    for line in output.splitlines():
+        record = json_loads(line)
+        index = int(record["custom_id"][1:])
+        if record.get("error") or record["response"]["status_code"] != 200:
+            continue
+        try:
+            results[index] = _assign_categories(batches[index], record["response"]["body"]["choices"][0]["message"]["content"], industry)
         except Exception as e:
             print(f"Batch parse error: {e}")
-            for msg in batch:
-                cat = _classify_single(msg, industry)
-                counts[cat] += 1
 
-    return counts
+    # Batches that errored or came back unparseable go through the per-message fallback
+    return [
+        category
+        for batch, categories in zip(batches, results)
+        for category in (categories or [_classify_single(msg, industry) for msg in batch])
+    ]
 
 
-def _classify_single(message: str, industry: str = "general") -> str:
-    """Fallback: classify a single message with industry context."""
+def _classify_messages(messages: list[str], industry: str, batch_size: int, mode: str) -> list[str]:
+    """Category for each message, in order: from the cache where possible, else from the model."""
+    if mode not in ("realtime", "batch"):
+        raise ValueError(f"Unknown classification mode '{mode}'")
+
+    categories = [_classification_cache.get(_cache_key(msg, industry)) for msg in messages]
+    uncached = [i for i, category in enumerate(categories) if category is None]
+
+    if uncached:
+        batches = _pack_batches([messages[i] for i in uncached], industry, batch_size)
+        if mode == "batch":
+            classified = _classify_with_batch_api(batches, industry)
+        else:
+            # Called from worker threads (never from inside a running event loop)
+            classified = asyncio.run(_classify_batches(batches, industry))
+        for i, category in zip(uncached, classified):
+            categories[i] = category
+    return categories
+
+
+def classify_batch(messages: list[str], industry: str = "general", batch_size: int = MAX_BATCH_MESSAGES, mode: str = "realtime") -> Counter:
+    """
+    Classify messages in batches to reduce API calls and provide industry context.
+    Batches are packed up to a token budget, with at most batch_size messages each.
+    Batches are sent concurrently, so latency is that of the slowest batch, not their sum.
+    Messages already in the classification cache are counted without an API call.
+    mode="batch" uses the Batch API instead (cheaper, but slow; for offline reports).
+    """
+    return Counter(_classify_messages(messages, industry, batch_size, mode))
+
+
+def _single_request(message: str, industry: str) -> dict:
+    """Chat completion parameters for classifying one message on its own."""
     categories = INDUSTRY_CATEGORIES.get(industry, INDUSTRY_CATEGORIES["general"])
     category_list = ", ".join(categories)
+    return {
+        "model": "gpt-4o-mini",
+        "messages": [
+            {
+                "role": "system",
+                "content": f"Classify this {industry} sector message into EXACTLY ONE category: {category_list}. Reply with ONLY the category name.",
+            },
+            {"role": "user", "content": message[:1000]},
+        ],
+        "temperature": 0.0,
+        "max_tokens": 50,
+    }
+
 
+def _classify_single(message: str, industry: str = "general") -> str:
+    """Fallback: classify a single message with industry context."""
     try:
-        response = _get_client().chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {
-                    "role": "system",
-                    "content": f"Classify this {industry} sector message into EXACTLY ONE category: {category_list}. Reply with ONLY the category name.",
-                },
-                {"role": "user", "content": message[:1000]},
-            ],
-            temperature=0.0,
-            max_tokens=50,
-        )
+        response = _get_client().chat.completions.create(**_single_request(message, industry))
         result = response.choices[0].message.content.strip()
         
         # Match result to categories
-        for cat in categories:
-            if cat.lower() == result.lower() or cat.lower() in result.lower():
-                return cat
+        return _match_category(result, industry)
+    except Exception:
         return "Other"
+
+
+async def _aclassify_single(client: AsyncOpenAI, message: str, industry: str, semaphore: asyncio.Semaphore) -> str:
+    """Async twin of _classify_single, sharing the batch run's client and concurrency limit."""
+    try:
+        async with semaphore:
+            response = await client.chat.completions.create(**_single_request(message, industry))
+        return _match_category(response.choices[0].message.content.strip(), industry)
     except Exception:
         return "Other"
 
 
-def classify_bulk(messages: list, industry: str = "general") -> Counter:
+def classify_bulk(messages: list, industry: str = "general", mode: str = "realtime") -> Counter:
     """
     Main entry point — classifies up to 200 messages using batch processing.
-    Backward compatible with the old API.
+    Backward compatible with the old API; mode="batch" routes through the Batch API.
     """
     # Limit to 200 messages to control costs
     limited = [str(m) for m in messages[:200] if str(m).strip()]
     if not limited:
         return Counter({"Other": 1})
 
-    return classify_batch(limited, industry=industry, batch_size=10)
+    # Repeated messages are classified once and counted as often as they occur
+    # (the model only ever sees the first 800 chars, so that is the identity)
+    occurrences = Counter(m.strip()[:800] for m in limited)
+    unique = list(occurrences)
+    counts = Counter()
+    for msg, category in zip(unique, _classify_messages(unique, industry, batch_size=MAX_BATCH_MESSAGES, mode=mode)):
+        counts[category] += occurrences[msg]
+    return counts
 
 
 def get_available_industries() -> list[str]:
@@ -272,24 +490,23 @@ def get_available_industries() -> list[str]:
     return list(INDUSTRY_CATEGORIES.keys())
 
 
-def generate_recommendations(category_counts: Counter, total_messages: int, industry: str = "general") -> list[str]:
+@lru_cache(maxsize=128)
+def _llm_recommendations(industry: str, top_categories: tuple, total_messages: int) -> tuple:
     """
-    Use AI to generate specific, actionable recommendations based on the actual audit data.
+    Ask the model for recommendations. Memoized on the exact inputs it sees;
+    failures raise, and lru_cache never caches an exception.
     """
-    # Build a summary of findings
-    top_categories = category_counts.most_common(5)
     findings_text = "\n".join(
         f"- {cat}: {count} messages ({int(count / total_messages * 100)}%)"
         for cat, count in top_categories
     )
 
-    try:
-        response = _get_client().chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {
-                    "role": "system",
-                    "content": """You are an AI automation consultant. Based on the business audit data provided,
+    response = _get_client().chat.completions.create(
+        model="gpt-4o-mini",
+        messages=[
+            {
+                "role": "system",
+                "content": """You are an AI automation consultant. Based on the business audit data provided,
 generate 5-7 specific, actionable recommendations for AI automation.
 
 Each recommendation should:
@@ -300,33 +517,49 @@ Each recommendation should:
 
 Respond with a JSON array of strings, each being one recommendation.
 Example: ["Deploy an AI chatbot to handle Order Status queries (35% of volume) — estimated 120 hours/month saved", ...]""",
-                },
-                {
-                    "role": "user",
-                    "content": f"""Industry: {industry}
+            },
+            {
+                "role": "user",
+                "content": f"""Industry: {industry}
 Total messages analyzed: {total_messages}
 
 Category breakdown:
 {findings_text}
 
 Generate specific automation recommendations based on this data.""",
-                },
-            ],
-            temperature=0.7,
-            max_tokens=1500,
-        )
+            },
+        ],
+        temperature=0.7,
+        max_tokens=1500,
+    )
 
-        result_text = response.choices[0].message.content.strip()
-        if result_text.startswith("```"):
-            result_text = result_text.split("\n", 1)[1]
-            result_text = result_text.rsplit("```", 1)[0]
+    result_text = response.choices[0].message.content.strip()
+    if result_text.startswith("```"):
+        result_text = result_text.split("\n", 1)[1]
+        result_text = result_text.rsplit("```", 1)[0]
 
-        recommendations = json.loads(result_text)
-        if isinstance(recommendations, list):
-            return recommendations[:7]
+    recommendations = json_loads(result_text)
+    if not isinstance(recommendations, list):
+        raise ValueError("expected a JSON array of recommendations")
+    return tuple(recommendations[:7])
 
-    except Exception as e:
-        print(f"⚠️ Recommendation generation failed: {e}")
+
+def generate_recommendations(category_counts: Counter, total_messages: int, industry: str = "general") -> list[str]:
+    """
+    Use AI to generate specific, actionable recommendations based on the actual audit data.
+    Small audits and single-category audits get the rule-based recommendations directly.
+    """
+    top_categories = category_counts.most_common(5)
+
+    worth_llm_call = (
+        total_messages >= RECOMMENDATION_LLM_MIN_MESSAGES
+        and top_categories[0][1] / total_messages <= RECOMMENDATION_LLM_MAX_SHARE
+    )
+    if worth_llm_call:
+        try:
+            return list(_llm_recommendations(industry, tuple(top_categories), total_messages))
+        except Exception as e:
+            print(f"⚠️ Recommendation generation failed: {e}")
 
     # Fallback: rule-based recommendations
     recommendations = []
@@ -2,13 +2,28 @@
 Audit Runner — Orchestrates the audit pipeline.
 Now accepts any file type (not just CSV) and passes structured data to the PDF generator.
 """
-from services.pdf_report import create_pdf
+
+
+# ─── Report builder ─────────────────────────────────────────────────
+# pdf_report pulls in the whole reportlab stack, so it is imported on first
+# use (or by the startup warmup) rather than when the app module loads
+def _build_report(audit_data: dict):
+    from services.pdf_report import create_pdf
+    return create_pdf(audit_data)
+
+def warm_report_builder():
+    """Load reportlab in this process ahead of the first audit"""
+    try:
+        import services.pdf_report  # noqa: F401
+        print("✅ PDF report builder warmed up")
+    except Exception as e:
+        print(f"⚠️ PDF report warmup failed: {e}")
 
 
 def run_audit_pipeline(messages: list, audit_data: dict):
     """
     Generate a professional PDF audit report from structured audit data.
-    
+
     Args:
         messages: List of raw message strings that were analyzed
         audit_data: Dictionary containing:
@@ -20,5 +35,5 @@ def run_audit_pipeline(messages: list, audit_data: dict):
             - cost_reduction_annually: str
             - automation_score: int
     """
-    create_pdf(audit_data)
+    _build_report(audit_data)
     print(f"✅ Audit pipeline complete — {audit_data['total_messages']} messages processed")
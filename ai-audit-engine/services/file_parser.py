@@ -2,12 +2,37 @@ import pandas as pd
 from PyPDF2 import PdfReader
 from PIL import Image
 import io
+import os
+import gzip
+import json
+import hashlib
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+try:
+    # PDFium (native) extracts text far faster than pure-Python PyPDF2
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+CSV_SAMPLE_ROWS = 1_000    # Rows read up front to pick the text columns
+CSV_CHUNK_ROWS = 50_000    # Rows parsed per chunk when streaming a CSV
 
 def parse_csv(file_path):
     """Parse CSV file and return list of text content"""
     try:
-        df = pd.read_csv(file_path)
-        return _extract_relevant_text(df)
+        # Pick the text columns from a small sample, then stream the file in
+        # chunks parsing only those columns, so memory stays flat on big files
+        sample = pd.read_csv(file_path, nrows=CSV_SAMPLE_ROWS)
+        text_cols = _find_text_columns(sample)
+        usecols = [sample.columns.get_loc(col) for col in text_cols] if text_cols else None
+
+        messages = []
+        for chunk in pd.read_csv(file_path, usecols=usecols, chunksize=CSV_CHUNK_ROWS):
+            messages.extend(_join_text_columns(chunk, text_cols))
+        return messages
     except Exception as e:
         print(f"Error parsing CSV: {e}")
         return []
@@ -15,7 +40,11 @@ def parse_csv(file_path):
 def parse_excel(file_path):
     """Parse Excel file and return list of text content"""
     try:
-        df = pd.read_excel(file_path)
+        try:
+            # Rust-based reader: several times faster than openpyxl, and reads legacy .xls too
+            df = pd.read_excel(file_path, engine="calamine")
+        except ImportError:
+            df = pd.read_excel(file_path)
         return _extract_relevant_text(df)
     except Exception as e:
         print(f"Error parsing Excel: {e}")
@@ -23,6 +52,10 @@ def parse_excel(file_path):
 
 def _extract_relevant_text(df):
     """Internal helper to identify text columns and extract content"""
+    return _join_text_columns(df, _find_text_columns(df))
+
+def _find_text_columns(df):
+    """Identify the text-heavy columns worth classifying"""
     # Identify text-heavy columns
     text_cols = []
     text_keywords = ['message', 'subject', 'description', 'content', 'body', 'text', 'comment', 'review', 'summary', 'details']
@@ -34,39 +67,145 @@ def _extract_relevant_text(df):
     
     # If no keywords found, look for columns with long strings
     if not text_cols:
-        for col in df.columns:
+        # Only object/string columns can hold text; numeric and date columns are skipped outright
+        for col, values in df.select_dtypes(include=["object", "string"]).items():
             # Check if majority of values are strings and have some length
-            sample = df[col].dropna().head(10)
-            if not sample.empty and sample.apply(lambda x: isinstance(x, str) and len(x) > 10).mean() > 0.5:
+            sample = values.dropna().head(10)
+            try:
+                # .str.len() is NaN for non-string cells, so they never count as long
+                long_share = sample.str.len().gt(10).mean()
+            except AttributeError:
+                continue  # No strings in the sample at all
+            if not sample.empty and long_share > 0.5:
                 text_cols.append(col)
                 
     # If still no candidates, fallback to all columns but exclude very short ones (IDs, numbers)
     if not text_cols:
         text_cols = [col for col in df.columns if not ('id' in str(col).lower() or 'num' in str(col).lower())]
 
+    return text_cols
+
+def _join_text_columns(df, text_cols):
+    """Combine each row's text columns into one message (every cell if there are none)"""
     if not text_cols:
-        return df.astype(str).values.flatten().tolist()
-
-    # Combine text from relevant columns
-    messages = []
-    for _, row in df[text_cols].iterrows():
-        # Combine non-null values into a single string for that row
-        msg_parts = [str(val).strip() for val in row if pd.notnull(val) and len(str(val).strip()) > 3]
-        if msg_parts:
-            messages.append(" | ".join(msg_parts))
-            
-    return messages
+        return _flatten_df(df)
 
-def parse_pdf(file_path):
-    """Parse PDF file and return list of text content"""
+    # Combine text from relevant columns, one column at a time (vectorized, no
+    # per-row Python): each non-null value longer than 3 chars contributes
+    # "value | ", and the trailing separator is cut once at the end
+    cells = df[text_cols].astype("string")
+    joined = None
+    for col in cells.columns:
+        values = cells[col].str.strip()
+        part = (values + " | ").where(values.str.len() > 3, "")
+        joined = part if joined is None else joined + part
+
+    joined = joined[joined != ""]
+    return joined.str[:-3].tolist()
+
+def _flatten_df(df):
+    """Every non-null cell as a string, row by row"""
+    if df.columns.empty:
+        return []
+    # Null cells are dropped rather than sent on as literal "nan" messages
+    cells = df.astype(str).to_numpy().ravel()
+    return cells[df.notna().to_numpy().ravel()].tolist()
+
+# Big PDFs are split into page ranges extracted in worker processes (text
+# extraction is CPU-bound and PDFium is not thread-safe). Small ones aren't
+# worth the hand-off.
+PDF_PARALLEL_MIN_PAGES = 200
+PDF_PAGES_PER_TASK = 100
+
+def _pdf_worker_count():
+    """PDF_WORKERS if set, else this process's share of the usable CPUs (max 4)"""
+    if os.getenv("PDF_WORKERS"):
+        return max(1, int(os.getenv("PDF_WORKERS")))
     try:
-        text_lines = []
+        # Respects CPU pinning/affinity, unlike os.cpu_count()
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:  # macOS / Windows
+        cpus = os.cpu_count() or 1
+    # Every uvicorn worker gets its own pool, so they split the CPUs between them
+    web_workers = max(1, int(os.getenv("WEB_CONCURRENCY", "1")))
+    return max(1, min(4, cpus // web_workers))
+
+PDF_WORKERS = _pdf_worker_count()  # Below 2, big PDFs are extracted in-process
+
+_pdf_pool = None
+_pdf_pool_lock = threading.Lock()
+
+def _get_pdf_pool():
+    """Process pool for PDF extraction, started on first use"""
+    global _pdf_pool
+    with _pdf_pool_lock:
+        if _pdf_pool is None:
+            # spawn, not fork: the server process runs threads
+            _pdf_pool = ProcessPoolExecutor(max_workers=PDF_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+        return _pdf_pool
+
+def shutdown_pdf_pool():
+    """Stop the PDF worker processes, if any were started"""
+    global _pdf_pool
+    with _pdf_pool_lock:
+        if _pdf_pool is not None:
+            _pdf_pool.shutdown(cancel_futures=True)
+            _pdf_pool = None
+
+# PDFium allows only one call at a time per process, even on different
+# documents, and parse_file runs in several threads at once
+_pdfium_lock = threading.Lock()
+
+def _pdf_page_count(file_path):
+    if pdfium is not None:
+        with _pdfium_lock:
+            pdf = pdfium.PdfDocument(file_path)
+            try:
+                return len(pdf)
+            finally:
+                pdf.close()
+    return len(PdfReader(file_path).pages)
+
+def _extract_pdf_pages(file_path, start, stop):
+    """Raw text lines of pages [start, stop); each call opens its own document"""
+    text_lines = []
+    if pdfium is not None:
+        with _pdfium_lock:
+            pdf = pdfium.PdfDocument(file_path)
+            try:
+                for index in range(start, stop):
+                    page = pdf[index]
+                    textpage = page.get_textpage()
+                    text_lines.extend(textpage.get_text_range().splitlines())
+                    textpage.close()
+                    page.close()
+            finally:
+                pdf.close()
+    else:
         reader = PdfReader(file_path)
-        
-        for page in reader.pages:
+
+        for page in reader.pages[start:stop]:
             text = page.extract_text()
             if text:
                 text_lines.extend(text.split('\n'))
+    return text_lines
+
+def parse_pdf(file_path):
+    """Parse PDF file and return list of text content"""
+    try:
+        page_count = _pdf_page_count(file_path)
+        if page_count < PDF_PARALLEL_MIN_PAGES or PDF_WORKERS < 2:
+            text_lines = _extract_pdf_pages(file_path, 0, page_count)
+        else:
+            starts = range(0, page_count, PDF_PAGES_PER_TASK)
+            stops = [min(start + PDF_PAGES_PER_TASK, page_count) for start in starts]
+            try:
+                chunks = _get_pdf_pool().map(_extract_pdf_pages, [file_path] * len(starts), starts, stops)
+                text_lines = [line for chunk in chunks for line in chunk]
+            except BrokenProcessPool:
+                # A worker died; drop the pool (the next big PDF starts a fresh one)
+                shutdown_pdf_pool()
+                text_lines = _extract_pdf_pages(file_path, 0, page_count)
         
         return [line.strip() for line in text_lines if line.strip()]
     except Exception as e:
@@ -97,15 +236,66 @@ def parse_txt(file_path):
     """Parse text file and return list of lines"""
     try:
         with open(file_path, "r", encoding="utf-8", errors='ignore') as f:
-            return [line.strip() for line in f.readlines() if line.strip()]
+            # Iterate the handle: no full-file list of raw lines, one strip per line
+            return [s for s in (line.strip() for line in f) if s]
     except Exception as e:
         print(f"Error parsing text file: {e}")
         return []
 
+# Opt-in on-disk cache of parse results, keyed by file content. Off unless
+# PARSE_CACHE_DIR is set, since it keeps extracted customer text on disk.
+PARSE_CACHE_DIR = os.getenv("PARSE_CACHE_DIR", "")
+PARSE_CACHE_VERSION = "1"  # Bump when parser output changes, to orphan old entries
+CACHEABLE_EXTENSIONS = (".csv", ".xlsx", ".xls", ".pdf", ".txt")
+
+def _parse_cache_path(file_path):
+    """Cache file for this upload's content, or None when caching doesn't apply"""
+    ext = os.path.splitext(file_path)[1].lower()
+    if not PARSE_CACHE_DIR or ext not in CACHEABLE_EXTENSIONS:
+        return None
+    digest = hashlib.sha256(PARSE_CACHE_VERSION.encode())
+    try:
+        with open(file_path, "rb") as f:
+            while block := f.read(1024 * 1024):
+                digest.update(block)
+    except OSError:
+        return None
+    return os.path.join(PARSE_CACHE_DIR, f"{digest.hexdigest()}{ext}.json.gz")
+
+def _read_parse_cache(cache_path):
+    try:
+        with gzip.open(cache_path, "rt", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _write_parse_cache(cache_path, messages):
+    try:
+        os.makedirs(PARSE_CACHE_DIR, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump(messages, f)
+        os.replace(tmp_path, cache_path)  # Atomic: readers never see a partial entry
+    except OSError as e:
+        print(f"Could not write parse cache: {e}")
+
 def parse_file(file_path):
     """
     Main parser function - detects file type and routes to appropriate parser
     """
+    cache_path = _parse_cache_path(file_path)
+    if cache_path:
+        cached = _read_parse_cache(cache_path)
+        if cached is not None:
+            return cached
+
+    messages = _parse_by_type(file_path)
+    if cache_path and messages:
+        _write_parse_cache(cache_path, messages)
+    return messages
+
+def _parse_by_type(file_path):
+    """Route to the parser for the file's extension"""
     file_lower = file_path.lower()
     
     try:
@@ -10,9 +10,13 @@ from reportlab.platypus import (
     SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, HRFlowable
 )
 from reportlab.lib import colors
-from reportlab.lib.enums import TA_CENTER, TA_LEFT
+from reportlab.lib.enums import TA_CENTER
+from reportlab.pdfbase.pdfmetrics import getFont
+import io
 import os
 from datetime import datetime
+from itertools import chain
+from xml.sax.saxutils import escape
 
 
 # ─── Color palette matching the Synth brand ──────────────────────────
@@ -22,6 +26,144 @@ DARK_BG = colors.HexColor('#1F2937')
 GRAY_TEXT = colors.HexColor('#6B7280')
 LIGHT_BG = colors.HexColor('#F9FAFB')
 WHITE = colors.white
+_BORDER_COLOR = colors.HexColor('#E5E7EB')
+
+# Default report location, resolved once at import
+_BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_OUTPUT_DIR = os.path.join(_BASE_DIR, "output")
+os.makedirs(_OUTPUT_DIR, exist_ok=True)
+
+_DATE_FMT = '%B %d, %Y at %I:%M %p'
+
+NEXT_STEPS = (
+    "Review this report with your operations and technology teams",
+    "Prioritize the top 2-3 opportunities with highest ROI potential",
+    "Schedule a consultation with Synth AI to discuss custom agent development",
+    "Begin pilot implementation of the highest-impact automation solution",
+    "Monitor KPIs (response time, resolution rate, cost per ticket) for 30 days",
+)
+
+# Categories rated "High" automation potential in the breakdown table
+HIGH_AUTOMATION = frozenset({
+    "Order Status", "Refund/Return", "Payment Issue", "Billing Inquiry",
+    "Technical Support", "Account Access", "Shipping/Delivery",
+    "Leave Request", "Access/Permissions", "Software Issue",
+})
+
+
+# Load the Times metrics at import so worker start-up, not the first report, pays for them
+for _font_name in ('Times-Roman', 'Times-Bold'):
+    getFont(_font_name)
+
+
+# ─── Paragraph styles (built once at import, shared by every report) ─
+_STYLES = getSampleStyleSheet()
+
+TITLE_STYLE = ParagraphStyle(
+    'SynthTitle',
+    parent=_STYLES['Heading1'],
+    fontName='Times-Bold',
+    fontSize=28,
+    textColor=SYNTH_GREEN,
+    spaceAfter=8,
+    alignment=TA_CENTER,
+)
+
+SUBTITLE_STYLE = ParagraphStyle(
+    'SynthSubtitle',
+    parent=_STYLES['Normal'],
+    fontName='Times-Roman',
+    fontSize=12,
+    textColor=GRAY_TEXT,
+    spaceAfter=20,
+    alignment=TA_CENTER,
+)
+
+HEADING_STYLE = ParagraphStyle(
+    'SynthHeading',
+    parent=_STYLES['Heading2'],
+    fontName='Times-Bold',
+    fontSize=16,
+    textColor=DARK_BG,
+    spaceAfter=10,
+    spaceBefore=24,
+)
+
+BODY_STYLE = ParagraphStyle(
+    'SynthBody',
+    parent=_STYLES['BodyText'],
+    fontName='Times-Roman',
+    fontSize=11,
+    textColor=DARK_BG,
+    spaceAfter=8,
+    leading=16,
+)
+
+METRIC_LABEL_STYLE = ParagraphStyle(
+    'MetricLabel',
+    parent=_STYLES['Normal'],
+    fontName='Times-Roman',
+    fontSize=9,
+    textColor=GRAY_TEXT,
+    alignment=TA_CENTER,
+)
+
+METRIC_VALUE_STYLE = ParagraphStyle(
+    'MetricValue',
+    parent=_STYLES['Normal'],
+    fontName='Times-Bold',
+    fontSize=20,
+    textColor=SYNTH_GREEN,
+    alignment=TA_CENTER,
+    spaceAfter=4,
+)
+
+DATE_LINE_STYLE = ParagraphStyle(
+    'DateLine', parent=BODY_STYLE, fontSize=9, textColor=GRAY_TEXT, alignment=TA_CENTER
+)
+
+# Numbered list items carry the inter-item gap themselves, so lists need no Spacers
+LIST_ITEM_STYLE = ParagraphStyle(
+    'ListItem', parent=BODY_STYLE, spaceAfter=BODY_STYLE.spaceAfter + 4
+)
+
+FOOTER_STYLE = ParagraphStyle(
+    'Footer', parent=BODY_STYLE, fontSize=8, textColor=GRAY_TEXT, alignment=TA_CENTER
+)
+
+
+# ─── Table styles (stateless once built, shared by every report) ─────
+METRICS_TABLE_STYLE = TableStyle([
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('BACKGROUND', (0, 0), (-1, -1), LIGHT_BG),
+    ('BOX', (0, 0), (-1, -1), 1, _BORDER_COLOR),
+    ('INNERGRID', (0, 0), (-1, -1), 0.5, _BORDER_COLOR),
+    ('TOPPADDING', (0, 0), (-1, 0), 18),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
+    ('TOPPADDING', (0, 1), (-1, 1), 8),
+    ('BOTTOMPADDING', (0, 1), (-1, 1), 18),
+])
+
+CATEGORY_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), SYNTH_GREEN),
+    ('TEXTCOLOR', (0, 0), (-1, 0), WHITE),
+    ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Times-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
+    ('TOPPADDING', (0, 0), (-1, 0), 10),
+    ('BACKGROUND', (0, 1), (-1, -1), LIGHT_BG),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [LIGHT_BG, WHITE]),
+    ('BOX', (0, 0), (-1, -1), 1, _BORDER_COLOR),
+    ('INNERGRID', (0, 0), (-1, -1), 0.5, _BORDER_COLOR),
+    ('TOPPADDING', (0, 1), (-1, -1), 6),
+    ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
+    # Body cells are plain strings, styled here instead of per-cell Paragraphs
+    ('FONTNAME', (0, 1), (-1, -1), 'Times-Roman'),
+    ('TEXTCOLOR', (0, 1), (-1, -1), DARK_BG),
+    ('LEFTPADDING', (0, 1), (-1, -1), 4),
+])
 
 
 def create_pdf(audit_data: dict, output_path: str = None):
@@ -41,13 +183,12 @@ def create_pdf(audit_data: dict, output_path: str = None):
     """
     # Determine output path
     if output_path is None:
-        base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        output_folder = os.path.join(base_dir, "output")
-        os.makedirs(output_folder, exist_ok=True)
-        output_path = os.path.join(output_folder, "audit_report.pdf")
+        output_path = os.path.join(_OUTPUT_DIR, "audit_report.pdf")
 
+    # Lay out into memory; the finished file hits disk in a single write
+    buf = io.BytesIO()
     doc = SimpleDocTemplate(
-        output_path,
+        buf,
         pagesize=letter,
         rightMargin=60,
         leftMargin=60,
@@ -55,265 +196,191 @@ def create_pdf(audit_data: dict, output_path: str = None):
         bottomMargin=50,
     )
 
-    # ─── Custom Styles ──────────────────────────────────────────────
-    styles = getSampleStyleSheet()
-
-    title_style = ParagraphStyle(
-        'SynthTitle',
-        parent=styles['Heading1'],
-        fontName='Times-Bold',
-        fontSize=28,
-        textColor=SYNTH_GREEN,
-        spaceAfter=8,
-        alignment=TA_CENTER,
-    )
-
-    subtitle_style = ParagraphStyle(
-        'SynthSubtitle',
-        parent=styles['Normal'],
-        fontName='Times-Roman',
-        fontSize=12,
-        textColor=GRAY_TEXT,
-        spaceAfter=20,
-        alignment=TA_CENTER,
-    )
-
-    heading_style = ParagraphStyle(
-        'SynthHeading',
-        parent=styles['Heading2'],
-        fontName='Times-Bold',
-        fontSize=16,
-        textColor=DARK_BG,
-        spaceAfter=10,
-        spaceBefore=24,
-    )
-
-    body_style = ParagraphStyle(
-        'SynthBody',
-        parent=styles['BodyText'],
-        fontName='Times-Roman',
-        fontSize=11,
-        textColor=DARK_BG,
-        spaceAfter=8,
-        leading=16,
-    )
-
-    metric_label_style = ParagraphStyle(
-        'MetricLabel',
-        parent=styles['Normal'],
-        fontName='Times-Roman',
-        fontSize=9,
-        textColor=GRAY_TEXT,
-        alignment=TA_CENTER,
-    )
-
-    metric_value_style = ParagraphStyle(
-        'MetricValue',
-        parent=styles['Normal'],
-        fontName='Times-Bold',
-        fontSize=20,
-        textColor=SYNTH_GREEN,
-        alignment=TA_CENTER,
-        spaceAfter=4,
-    )
-
     # ─── Build the PDF ──────────────────────────────────────────────
-    story = []
-
-    # === HEADER ===
-    story.append(Spacer(1, 0.3 * inch))
-    story.append(Paragraph("SYNTH AI", title_style))
-    story.append(Paragraph("AI Automation Opportunity Audit Report", subtitle_style))
-    story.append(Paragraph(
-        f"Generated on {datetime.now().strftime('%B %d, %Y at %I:%M %p')}",
-        ParagraphStyle('DateLine', parent=body_style, fontSize=9, textColor=GRAY_TEXT, alignment=TA_CENTER)
-    ))
-    story.append(Spacer(1, 0.1 * inch))
-    story.append(HRFlowable(width="100%", thickness=1, color=SYNTH_GREEN))
-    story.append(Spacer(1, 0.2 * inch))
+    now_str = datetime.now().strftime(_DATE_FMT)
 
-    # === EXECUTIVE SUMMARY ===
-    story.append(Paragraph("EXECUTIVE SUMMARY", heading_style))
-    
+    # Headline figures, read once and shared by the sections that show them
     total = audit_data.get("total_messages", 0)
     score = audit_data.get("automation_score", 0)
     time_saved = audit_data.get("time_saved_annually", "N/A")
     cost_saved = audit_data.get("cost_reduction_annually", "N/A")
-    
-    story.append(Paragraph(
-        f"This audit analyzed <b>{total}</b> business messages and communications. "
-        f"Our AI engine identified an <b>automation score of {score}/100</b>, indicating "
-        f"{'significant' if score > 60 else 'moderate' if score > 30 else 'some'} "
-        f"potential for AI-powered automation in your operations. "
-        f"Implementing our recommendations could save your organization approximately "
-        f"<b>{time_saved}</b> of manual work and <b>{cost_saved}</b> annually.",
-        body_style
+
+    story = list(chain(
+        _build_header(now_str),
+        _build_summary(total, score, time_saved, cost_saved),
+        _build_metrics(total, score, time_saved, cost_saved),
+        _build_categories(audit_data.get("category_breakdown", {}), total),
+        _build_opportunities(audit_data),
+        _build_recommendations(audit_data),
+        _build_next_steps(),
+        _build_footer(),
     ))
-    story.append(Spacer(1, 0.2 * inch))
 
-    # === KEY METRICS (as a table) ===
-    story.append(Paragraph("KEY METRICS", heading_style))
-    
+    # Build
+    doc.build(story)
+    with open(output_path, "wb") as f:
+        f.write(buf.getvalue())
+    print(f"✅ Professional PDF report saved at: {output_path}")
+    return output_path
+
+
+# ─── Report sections (each returns fresh flowables) ──────────────────
+def _build_header(now_str: str) -> list:
+    return [
+        Spacer(1, 0.3 * inch),
+        Paragraph("SYNTH AI", TITLE_STYLE),
+        Paragraph("AI Automation Opportunity Audit Report", SUBTITLE_STYLE),
+        Paragraph(f"Generated on {now_str}", DATE_LINE_STYLE),
+        Spacer(1, 0.1 * inch),
+        HRFlowable(width="100%", thickness=1, color=SYNTH_GREEN),
+        Spacer(1, 0.2 * inch),
+    ]
+
+
+def _build_summary(total: int, score: int, time_saved: str, cost_saved: str) -> list:
+    return [
+        Paragraph("EXECUTIVE SUMMARY", HEADING_STYLE),
+        Paragraph(
+            f"This audit analyzed <b>{total}</b> business messages and communications. "
+            f"Our AI engine identified an <b>automation score of {score}/100</b>, indicating "
+            f"{'significant' if score > 60 else 'moderate' if score > 30 else 'some'} "
+            f"potential for AI-powered automation in your operations. "
+            f"Implementing our recommendations could save your organization approximately "
+            f"<b>{time_saved}</b> of manual work and <b>{cost_saved}</b> annually.",
+            BODY_STYLE
+        ),
+        Spacer(1, 0.2 * inch),
+    ]
+
+
+def _build_metrics(total: int, score: int, time_saved: str, cost_saved: str) -> list:
     metrics_data = [
         [
-            Paragraph(f"{total}", metric_value_style),
-            Paragraph(f"{score}/100", metric_value_style),
-            Paragraph(f"{time_saved}", metric_value_style),
-            Paragraph(f"{cost_saved}", metric_value_style),
+            Paragraph(f"{total}", METRIC_VALUE_STYLE),
+            Paragraph(f"{score}/100", METRIC_VALUE_STYLE),
+            Paragraph(f"{time_saved}", METRIC_VALUE_STYLE),
+            Paragraph(f"{cost_saved}", METRIC_VALUE_STYLE),
         ],
         [
-            Paragraph("Messages Analyzed", metric_label_style),
-            Paragraph("Automation Score", metric_label_style),
-            Paragraph("Annual Time Saved", metric_label_style),
-            Paragraph("Annual Cost Savings", metric_label_style),
+            Paragraph("Messages Analyzed", METRIC_LABEL_STYLE),
+            Paragraph("Automation Score", METRIC_LABEL_STYLE),
+            Paragraph("Annual Time Saved", METRIC_LABEL_STYLE),
+            Paragraph("Annual Cost Savings", METRIC_LABEL_STYLE),
         ],
     ]
-    
+
     metrics_table = Table(metrics_data, colWidths=[1.4 * inch] * 4)
-    metrics_table.setStyle(TableStyle([
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('BACKGROUND', (0, 0), (-1, -1), LIGHT_BG),
-        ('BOX', (0, 0), (-1, -1), 1, colors.HexColor('#E5E7EB')),
-        ('INNERGRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#E5E7EB')),
-        ('TOPPADDING', (0, 0), (-1, 0), 18),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
-        ('TOPPADDING', (0, 1), (-1, 1), 8),
-        ('BOTTOMPADDING', (0, 1), (-1, 1), 18),
-    ]))
-    story.append(metrics_table)
-    story.append(Spacer(1, 0.3 * inch))
-
-    # === CATEGORY BREAKDOWN TABLE ===
-    category_breakdown = audit_data.get("category_breakdown", {})
-    if category_breakdown:
-        story.append(Paragraph("CATEGORY BREAKDOWN", heading_style))
-        story.append(Paragraph(
+    metrics_table.setStyle(METRICS_TABLE_STYLE)
+    return [
+        Paragraph("KEY METRICS", HEADING_STYLE),
+        metrics_table,
+        Spacer(1, 0.3 * inch),
+    ]
+
+
+def _build_categories(category_breakdown: dict, total: int) -> list:
+    if not category_breakdown:
+        return []
+
+    # Sort by count descending
+    sorted_cats = sorted(category_breakdown.items(), key=lambda x: x[1], reverse=True)
+
+    # Header row is styled (bold, white on green) by CATEGORY_TABLE_STYLE
+    table_data = [["Category", "Count", "Percentage", "Automation Potential"]]
+
+    for cat, count in sorted_cats:
+        pct = f"{count * 100 // total}%" if total > 0 else "0%"
+        potential = "High" if cat in HIGH_AUTOMATION else "Medium"
+
+        table_data.append([cat, str(count), pct, potential])
+
+    cat_table = Table(table_data, colWidths=[2.2 * inch, 0.8 * inch, 1.0 * inch, 1.5 * inch])
+    cat_table.setStyle(CATEGORY_TABLE_STYLE)
+    return [
+        Paragraph("CATEGORY BREAKDOWN", HEADING_STYLE),
+        Paragraph(
             "The following table shows how your business communications were classified by our AI engine:",
-            body_style
-        ))
-        story.append(Spacer(1, 0.1 * inch))
-
-        # Sort by count descending
-        sorted_cats = sorted(category_breakdown.items(), key=lambda x: x[1], reverse=True)
-        
-        table_data = [
-            [
-                Paragraph("<b>Category</b>", body_style),
-                Paragraph("<b>Count</b>", body_style),
-                Paragraph("<b>Percentage</b>", body_style),
-                Paragraph("<b>Automation Potential</b>", body_style),
-            ]
-        ]
-        
-        high_automation = {"Order Status", "Refund/Return", "Payment Issue", "Billing Inquiry",
-                          "Technical Support", "Account Access", "Shipping/Delivery",
-                          "Leave Request", "Access/Permissions", "Software Issue"}
-        
-        for cat, count in sorted_cats:
-            pct = f"{int(count / total * 100)}%" if total > 0 else "0%"
-            potential = "High" if cat in high_automation else "Medium"
-            
-            table_data.append([
-                Paragraph(cat, body_style),
-                Paragraph(str(count), body_style),
-                Paragraph(pct, body_style),
-                Paragraph(potential, body_style),
-            ])
-        
-        cat_table = Table(table_data, colWidths=[2.2 * inch, 0.8 * inch, 1.0 * inch, 1.5 * inch])
-        cat_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), SYNTH_GREEN),
-            ('TEXTCOLOR', (0, 0), (-1, 0), WHITE),
-            ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Times-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
-            ('TOPPADDING', (0, 0), (-1, 0), 10),
-            ('BACKGROUND', (0, 1), (-1, -1), LIGHT_BG),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [LIGHT_BG, WHITE]),
-            ('BOX', (0, 0), (-1, -1), 1, colors.HexColor('#E5E7EB')),
-            ('INNERGRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#E5E7EB')),
-            ('TOPPADDING', (0, 1), (-1, -1), 6),
-            ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
-        ]))
-        story.append(cat_table)
-        story.append(Spacer(1, 0.3 * inch))
-
-    # === TOP OPPORTUNITIES ===
+            BODY_STYLE
+        ),
+        Spacer(1, 0.1 * inch),
+        cat_table,
+        Spacer(1, 0.3 * inch),
+    ]
+
+
+def _build_opportunities(audit_data: dict) -> list:
     top_opportunities = audit_data.get("top_opportunities", [])
-    if top_opportunities:
-        story.append(Paragraph("TOP AUTOMATION OPPORTUNITIES", heading_style))
-        story.append(Paragraph(
+    if not top_opportunities:
+        return []
+
+    section = [
+        Paragraph("TOP AUTOMATION OPPORTUNITIES", HEADING_STYLE),
+        Paragraph(
             "These are the highest-impact areas where AI automation can deliver immediate ROI:",
-            body_style
+            BODY_STYLE
+        ),
+        Spacer(1, 0.1 * inch),
+    ]
+
+    for i, opp in enumerate(top_opportunities, 1):
+        # Paragraph text is markup: escape &, < and > from upstream strings
+        area = escape(str(opp.get("area", "Unknown")))
+        count = opp.get("count", 0)
+        saving = opp.get("potential_saving", "0%")
+        impact = escape(str(opp.get("impact", "Medium")))
+
+        section.append(Paragraph(
+            f"<b>{i}. {area}</b> — {count} messages ({saving} of total volume) | Impact: <b>{impact}</b>",
+            BODY_STYLE
         ))
-        story.append(Spacer(1, 0.1 * inch))
-
-        for i, opp in enumerate(top_opportunities, 1):
-            area = opp.get("area", "Unknown")
-            count = opp.get("count", 0)
-            saving = opp.get("potential_saving", "0%")
-            impact = opp.get("impact", "Medium")
-            
-            story.append(Paragraph(
-                f"<b>{i}. {area}</b> — {count} messages ({saving} of total volume) | Impact: <b>{impact}</b>",
-                body_style
-            ))
-        
-        story.append(Spacer(1, 0.2 * inch))
-
-    # === AI-GENERATED RECOMMENDATIONS ===
+
+    section.append(Spacer(1, 0.2 * inch))
+    return section
+
+
+def _build_recommendations(audit_data: dict) -> list:
     recommendations = audit_data.get("recommendations", [])
-    if recommendations:
-        story.append(Paragraph("AI-POWERED RECOMMENDATIONS", heading_style))
-        story.append(Paragraph(
+    if not recommendations:
+        return []
+
+    return [
+        Paragraph("AI-POWERED RECOMMENDATIONS", HEADING_STYLE),
+        Paragraph(
             "Based on our analysis, here are specific, actionable strategies tailored to your data:",
-            body_style
-        ))
-        story.append(Spacer(1, 0.1 * inch))
-
-        for i, rec in enumerate(recommendations, 1):
-            story.append(Paragraph(f"<b>{i}.</b> {rec}", body_style))
-            story.append(Spacer(1, 4))
-
-        story.append(Spacer(1, 0.2 * inch))
-
-    # === NEXT STEPS ===
-    story.append(Paragraph("NEXT STEPS", heading_style))
-    next_steps = [
-        "Review this report with your operations and technology teams",
-        "Prioritize the top 2-3 opportunities with highest ROI potential",
-        "Schedule a consultation with Synth AI to discuss custom agent development",
-        "Begin pilot implementation of the highest-impact automation solution",
-        "Monitor KPIs (response time, resolution rate, cost per ticket) for 30 days",
+            BODY_STYLE
+        ),
+        Spacer(1, 0.1 * inch),
+        *(
+            Paragraph(f"<b>{i}.</b> {escape(str(rec))}", LIST_ITEM_STYLE)
+            for i, rec in enumerate(recommendations, 1)
+        ),
+        Spacer(1, 0.2 * inch),
     ]
-    for i, step in enumerate(next_steps, 1):
-        story.append(Paragraph(f"{i}. {step}", body_style))
-        story.append(Spacer(1, 4))
 
-    # === FOOTER ===
-    story.append(Spacer(1, 0.4 * inch))
-    story.append(HRFlowable(width="100%", thickness=1, color=colors.HexColor('#E5E7EB')))
-    story.append(Spacer(1, 0.1 * inch))
 
-    footer_style = ParagraphStyle(
-        'Footer', parent=body_style, fontSize=8, textColor=GRAY_TEXT, alignment=TA_CENTER
-    )
-    story.append(Paragraph(
-        "This report is confidential and prepared exclusively for the recipient organization.",
-        footer_style
-    ))
-    story.append(Paragraph(
-        "Powered by Synth AI — Discover What Your Company Can Automate With AI",
-        footer_style
-    ))
-    story.append(Paragraph(
-        "contact@synth-ai.com | synth-ai.com",
-        footer_style
-    ))
+def _build_next_steps() -> list:
+    return [
+        Paragraph("NEXT STEPS", HEADING_STYLE),
+        *(
+            Paragraph(f"{i}. {step}", LIST_ITEM_STYLE)
+            for i, step in enumerate(NEXT_STEPS, 1)
+        ),
+    ]
 
-    # Build
-    doc.build(story)
-    print(f"✅ Professional PDF report saved at: {output_path}")
-    return output_path
\ No newline at end of file
+
+def _build_footer() -> list:
+    return [
+        Spacer(1, 0.5 * inch),
+        Paragraph(
+            "This report is confidential and prepared exclusively for the recipient organization.",
+            FOOTER_STYLE
+        ),
+        Paragraph(
+            "Powered by Synth AI — Discover What Your Company Can Automate With AI",
+            FOOTER_STYLE
+        ),
+        Paragraph(
+            "contact@synth-ai.com | synth-ai.com",
+            FOOTER_STYLE
+        ),
+    ]
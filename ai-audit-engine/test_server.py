@@ -2,9 +2,10 @@
 Minimal test server - if this works, the problem is in your main.py
 """
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 import uvicorn
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 @app.get("/")
 def root():
@@ -16,7 +17,16 @@ if __name__ == "__main__":
     print("Open: http://127.0.0.1:8000")
     print("-" * 50 + "\n")
     
-    uvicorn.run(app, host="127.0.0.1", port=8000)
+    # "auto" picks uvloop + httptools when installed (not on Windows); no per-request access log
+    config = uvicorn.Config(
+        app,
+        host="127.0.0.1",
+        port=8000,
+        loop="auto",
+        http="auto",
+        access_log=False,
+    )
+    uvicorn.Server(config).run()
 
 
 